@@ -6,6 +6,7 @@ from typing import Optional, List
 from aws_cdk import (
     aws_lambda as _lambda,
     aws_iam as iam,
+    aws_ecr_assets as ecr_assets,
     Duration,
 )
 from constructs import Construct
@@ -25,6 +26,8 @@ class CustomLambdaFromDockerImage(Construct):
         initial_policy: Optional[List[iam.PolicyStatement]] = None,
         role: Optional[iam.IRole] = None,
         description: Optional[str] = None,
+        build_args: Optional[dict] = None,
+        architecture: _lambda.Architecture = _lambda.Architecture.X86_64,
         **kwargs,
     ) -> None:
         """Custom Lambda Construct for AWS CDK from a Docker image.
@@ -54,6 +57,11 @@ class CustomLambdaFromDockerImage(Construct):
             IAM role to attach to the Lambda function, by default None
         description : Optional[str], optional
             Description for the Lambda function, by default None
+        build_args : Optional[dict], optional
+            Docker build arguments for the image, by default None
+        architecture : _lambda.Architecture, optional
+            Instruction set architecture for the Lambda function and its
+            image, by default _lambda.Architecture.X86_64
         """
         super().__init__(scope, id, **kwargs)
 
@@ -90,7 +98,12 @@ class CustomLambdaFromDockerImage(Construct):
             code=_lambda.Code.from_asset_image(
                 directory=code_path,
                 # This assumes a Dockerfile is present in the src folder
+                build_args=build_args,
+                platform=ecr_assets.Platform.custom(
+                    architecture.docker_platform
+                ),
             ),
+            architecture=architecture,
             memory_size=memory_size,
             timeout=timeout,
             environment=powertools_env_vars,
@@ -51,10 +51,22 @@ class AutomatedTaskmasterStack(Stack):
             f"{self.subdomain_part}{self.stack_suffix}.{self.base_domain_name}"
         )
         self.api_prefix = self.node.try_get_context("api_prefix") or "/api/v1"
+        self.backend_provisioned_concurrency = int(
+            self.node.try_get_context("backend_provisioned_concurrency") or 0
+        )
+        # endregion
+
+        # region Lambda Image Configuration
+        # Every Lambda image builds FROM this base so they share its layers
+        self.lambda_base_image = "public.ecr.aws/lambda/python:3.12"
+        # Graviton (arm64) functions are cheaper and cold start as fast
+        self.lambda_architecture = lambda_.Architecture.ARM_64
         # endregion
 
         # region Import CloudFormation Outputs
-        # Import home IP SSM Parameter Name
+        # Import home IP SSM Parameter Name. The parameter holds the IP
+        # allowlist for the authorizer: a single IP address, or a
+        # comma-separated list of IP addresses and CIDR networks
         imported_home_ip_ssm_param_name = Fn.import_value(
             "home-ip-ssm-param-name"
         )
@@ -83,11 +95,24 @@ class AutomatedTaskmasterStack(Stack):
             environment={
                 "API_PREFIX": self.api_prefix,
             },
-            memory_size=512,
+            # 1769 MB is the threshold for one full vCPU, which speeds up INIT
+            memory_size=1769,
             timeout=Duration.seconds(30),
             description="Automated Taskmaster backend Lambda function",
         )
 
+        # Serve the backend through an alias so provisioned concurrency keeps
+        # initialized environments ready and INIT stays off the request path
+        taskmaster_backend_alias = lambda_.Alias(
+            self,
+            "TaskmasterBackendLiveAlias",
+            alias_name="live",
+            version=taskmaster_backend_lambda.current_version,
+            provisioned_concurrent_executions=(
+                self.backend_provisioned_concurrency or None
+            ),
+        )
+
         # IP Authorizer Lambda Function
         ip_authorizer_lambda = self.create_lambda_function(
             construct_id="IpAuthorizerLambda",
@@ -124,7 +149,7 @@ class AutomatedTaskmasterStack(Stack):
 
         # Create Lambda integration for the API
         taskmaster_integration = apigwv2_integrations.HttpLambdaIntegration(
-            "TaskmasterIntegration", handler=taskmaster_backend_lambda
+            "TaskmasterIntegration", handler=taskmaster_backend_alias
         )
 
         # Create proxy route for the API
@@ -248,6 +273,8 @@ class AutomatedTaskmasterStack(Stack):
             initial_policy=initial_policy or [],
             role=role,
             description=description,
+            build_args={"BASE_IMAGE": self.lambda_base_image},
+            architecture=self.lambda_architecture,
         )
         return custom_lambda.function
 
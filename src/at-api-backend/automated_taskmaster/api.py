@@ -1,11 +1,26 @@
+# Standard Library
+import os
+from functools import cache
+from typing import List
+
 # Third Party
 from fastapi import APIRouter
 
 # Local Modules
 from automated_taskmaster.routers import summon
 
-# Create a router instance with a default prefix
-router = APIRouter()
 
-# Include other routers
-router.include_router(summon.router)
+@cache
+def get_api_prefix() -> str:
+    """Get the API prefix from the environment, defaulting to '/api/v1'.
+
+    Returns
+    -------
+    str
+        The prefix all API routes and docs are mounted under.
+    """
+    return os.getenv("API_PREFIX", "/api/v1")
+
+
+# Routers mounted directly on the app under the API prefix
+routers: List[APIRouter] = [summon.router]
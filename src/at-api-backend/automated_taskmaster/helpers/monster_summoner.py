@@ -1,69 +1,335 @@
 # Standard Library
 import os
 import json
-from functools import lru_cache
-from typing import List, Dict, Any
+import pickle
+from bisect import bisect_left, bisect_right
+from functools import cache, lru_cache
+from itertools import islice
+from typing import (
+    List,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 # Third Party
-from aws_lambda_powertools import Logger
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - platforms without orjson wheels
+    from json import loads as _json_loads
 
 # Local Modules
 from automated_taskmaster.models.monster import Monster, MonsterSummonRequest
 
-# Initialize a logger
-logger = Logger(service="at-monster-summoner")
+if TYPE_CHECKING:
+    from aws_lambda_powertools import Logger
 
 # Static variables
 _MONSTER_DATA_FILE = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), "..", "data", "monsters.json"
 )
-_MONSTERS_CACHE: List[Monster] = []
+_MONSTER_SNAPSHOT_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data", "monsters.pkl"
+)
+
+# Bump whenever the snapshot layout or `_MonsterIndex` changes; changes to the
+# data itself are caught by the JSON file's size and mtime stored alongside it
+_SNAPSHOT_VERSION = 3
+
+# Challenge Ratings used by the monster data, pre-converted to floats
+_CR_LOOKUP: Dict[str, float] = {
+    "0": 0.0,
+    "1/8": 0.125,
+    "1/4": 0.25,
+    "1/2": 0.5,
+    **{str(cr): float(cr) for cr in range(1, 31)},
+}
+
+
+@lru_cache(maxsize=1)
+def _get_logger() -> "Logger":
+    """Create the module logger on first use.
+
+    The happy path loads the snapshot without logging, so the logger is only
+    built when the JSON fallback runs or something goes wrong.
+
+    Returns
+    -------
+    Logger
+        The logger for the monster summoner.
+    """
+    # Third Party
+    from aws_lambda_powertools import Logger
+
+    return Logger(service="at-monster-summoner")
+
+
+@lru_cache(maxsize=1)
+def _get_monster_list_adapter() -> TypeAdapter:
+    """Create the adapter used to validate the monster data in one pass.
+
+    Only validated loads need it, so its schema is not built at import.
+
+    Returns
+    -------
+    TypeAdapter
+        A `TypeAdapter` for a list of `Monster` objects.
+    """
+    return TypeAdapter(List[Monster])
+
+
+class _MonsterIndex(NamedTuple):
+    """Lookup structures used to filter the cached monsters."""
+
+    # Monster positions ordered by CR, and their CR values in that order
+    cr_sorted: List[int]
+    cr_sorted_values: List[float]
+    # Lowercased environment mapped to the positions of monsters found there
+    env_index: Dict[str, List[int]]
+
+
+# The cached monsters alongside their lookup structures
+_MonsterCatalog = Tuple[List[Monster], _MonsterIndex]
+
+
+def _read_monster_data(validate: bool = True) -> List[Monster]:
+    """Read the monsters from the JSON data file.
+
+    Parameters
+    ----------
+    validate : bool, optional
+        Whether to run Pydantic validation on each monster, by default True.
+        Invalid monsters are logged and skipped. The bundled data file is
+        trusted, so runtime loads skip validation and build the models with
+        `model_construct` instead.
+
+    Returns
+    -------
+    List[Monster]
+        A list of `Monster` objects parsed from the JSON file.
+    """
+    with open(_MONSTER_DATA_FILE, "rb") as f:
+        data = _json_loads(f.read())
+    if not validate:
+        return [Monster.model_construct(**monster) for monster in data]
+
+    # Validate the whole file in one pass, only going row by row on failure
+    try:
+        return _get_monster_list_adapter().validate_python(data)
+    except ValidationError:
+        pass
+
+    monsters = []
+    for i, monster in enumerate(data):
+        try:
+            monsters.append(Monster.model_validate(monster))
+        except ValidationError as e:
+            _get_logger().warning(
+                f"Skipping invalid monster at index {i}: {e}"
+            )
+    return monsters
+
+
+def _monster_data_stamp() -> Optional[Tuple[int, int]]:
+    """Stat the monster data file so stale snapshots can be detected.
+
+    Only the file's metadata is read, so checking the stamp on a cold start
+    does not bring back the JSON read the snapshot avoids.
+
+    Returns
+    -------
+    Optional[Tuple[int, int]]
+        The size and modification time in nanoseconds of the JSON file, or
+        None if the file cannot be found.
+    """
+    try:
+        stat = os.stat(_MONSTER_DATA_FILE)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _load_monster_snapshot() -> Optional[_MonsterCatalog]:
+    """Load the pre-built monster snapshot, if one is available.
+
+    Returns
+    -------
+    Optional[_MonsterCatalog]
+        The `Monster` objects and lookup structures stored in the snapshot,
+        or None if the snapshot does not exist, cannot be read, or was built
+        for a different `_SNAPSHOT_VERSION` or monster data file.
+    """
+    if not os.path.exists(_MONSTER_SNAPSHOT_FILE):
+        return None
+
+    try:
+        with open(_MONSTER_SNAPSHOT_FILE, "rb") as f:
+            version, data_stamp, monsters, index = pickle.load(f)
+    except Exception as e:
+        _get_logger().warning(
+            f"Unable to load monster snapshot, falling back to JSON: {e}"
+        )
+        return None
+
+    if version != _SNAPSHOT_VERSION:
+        _get_logger().warning(
+            f"Monster snapshot version {version} does not match "
+            f"{_SNAPSHOT_VERSION}, falling back to JSON."
+        )
+        return None
+    if data_stamp != _monster_data_stamp():
+        _get_logger().warning(
+            "Monster snapshot is out of date with the monster data file, "
+            "falling back to JSON."
+        )
+        return None
+    return monsters, index
+
+
+def build_monster_snapshot(path: str = _MONSTER_SNAPSHOT_FILE) -> None:
+    """Validate the JSON monster data and write it to a pickle snapshot.
+
+    The snapshot stores the monsters together with their lookup structures,
+    so loading it at runtime skips JSON parsing, Pydantic validation and
+    index building. Run this at build time with
+    `python -m automated_taskmaster.helpers.monster_summoner`.
+
+    Parameters
+    ----------
+    path : str, optional
+        Where to write the snapshot, by default `_MONSTER_SNAPSHOT_FILE`
+    """
+    monsters = _read_monster_data()
+    index = _build_monster_index(monsters)
+    snapshot = (_SNAPSHOT_VERSION, _monster_data_stamp(), monsters, index)
+    with open(path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=5)
+
+
+def _load_monsters_from_json() -> List[Monster]:
+    """Load the monsters from the JSON data file without validation.
+
+    Returns
+    -------
+    List[Monster]
+        A list of `Monster` objects loaded from the JSON file, or an empty
+        list if the monster data could not be loaded.
+    """
+    _get_logger().info(f"Loading monster data from: {_MONSTER_DATA_FILE}")
+    try:
+        monsters = _read_monster_data(validate=False)
+    except FileNotFoundError:
+        _get_logger().error(
+            f"Monster data file not found: {_MONSTER_DATA_FILE}"
+        )
+        return []
+    except json.JSONDecodeError as e:
+        _get_logger().error(f"Invalid JSON in monster data file: {e}")
+        return []
+    except Exception as e:
+        _get_logger().error(f"Unexpected error loading monster data: {e}")
+        return []
+
+    _get_logger().info(
+        f"Successfully loaded {len(monsters)} monsters from the data file."
+    )
+    return monsters
+
+
+def _build_monster_index(monsters: List[Monster]) -> _MonsterIndex:
+    """Build the lookup structures over the given monsters.
+
+    Parameters
+    ----------
+    monsters : List[Monster]
+        The monsters to index, in the order of the monster data file.
+
+    Returns
+    -------
+    _MonsterIndex
+        The CR-sorted positions and environment index for the monsters.
+    """
+    # Pre-compute CR floats so requests only compare values
+    cr_floats = [_convert_cr_to_float(monster.cr) for monster in monsters]
+
+    # Map each lowercased environment to the monsters found there
+    env_index: Dict[str, List[int]] = {}
+    for i, monster in enumerate(monsters):
+        for env in monster.environment:
+            indices = env_index.setdefault(env.lower(), [])
+            if not indices or indices[-1] != i:
+                indices.append(i)
+
+    # Index monsters by CR so range queries can bisect into a slice
+    cr_sorted = sorted(range(len(cr_floats)), key=cr_floats.__getitem__)
+    return _MonsterIndex(
+        cr_sorted=cr_sorted,
+        cr_sorted_values=[cr_floats[i] for i in cr_sorted],
+        env_index=env_index,
+    )
 
 
 @lru_cache(maxsize=1)
+def _load_monster_catalog() -> _MonsterCatalog:
+    """Load the monsters and their lookup structures once per process.
+
+    Returns
+    -------
+    _MonsterCatalog
+        The monsters from the snapshot or JSON file, and their index.
+    """
+    # Prefer the pre-built snapshot, falling back to the JSON file
+    snapshot = _load_monster_snapshot()
+    if snapshot is not None:
+        return snapshot
+
+    # Unvalidated rows may be malformed, so indexing them can fail too
+    monsters = _load_monsters_from_json()
+    try:
+        return monsters, _build_monster_index(monsters)
+    except Exception as e:
+        _get_logger().error(f"Unable to index monster data: {e}")
+        return [], _build_monster_index([])
+
+
 def load_monsters_cached() -> List[Monster]:
     """Load monsters with caching to avoid repeated file I/O.
 
     Returns
     -------
     List[Monster]
-        A list of `Monster` objects loaded from the JSON file.
+        A list of `Monster` objects loaded from the snapshot or JSON file,
+        or an empty list if the monster data could not be loaded.
+    """
+    return _load_monster_catalog()[0]
+
+
+def _load_monster_index() -> _MonsterIndex:
+    """Get the lookup structures over the cached monsters.
 
-    Raises
+    Returns
     -------
-    FileNotFoundError
-        If the monster data file does not exist.
-    JSONDecodeError
-        If the monster data file contains invalid JSON.
-    Exception
-        For any other unexpected errors during file reading or parsing.
+    _MonsterIndex
+        The CR-sorted positions and environment index for the monsters
+        returned by `load_monsters_cached`.
     """
-    # Set up a global cache for monsters
-    global _MONSTERS_CACHE
+    return _load_monster_catalog()[1]
 
-    # If the cache is empty, load the data from the JSON file
-    if not _MONSTERS_CACHE:
-        logger.info(f"Loading monster data from: {_MONSTER_DATA_FILE}")
 
-        # Ensure the file exists before attempting to read it
-        try:
-            with open(_MONSTER_DATA_FILE, "r") as f:
-                data = json.load(f)
-            _MONSTERS_CACHE = [Monster(**monster) for monster in data]
-            logger.info(
-                f"Successfully loaded {len(_MONSTERS_CACHE)} monsters from the data file."
-            )
-        except FileNotFoundError:
-            logger.error(f"Monster data file not found: {_MONSTER_DATA_FILE}")
-            _MONSTERS_CACHE = []
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in monster data file: {e}")
-            _MONSTERS_CACHE = []
-        except Exception as e:
-            logger.error(f"Unexpected error loading monster data: {e}")
-            _MONSTERS_CACHE = []
+def warm_monster_cache() -> None:
+    """Load the monster data and build its lookup structures ahead of use.
 
-    return _MONSTERS_CACHE
+    Both are otherwise loaded lazily by the first request that needs them.
+    """
+    _load_monster_catalog()
 
 
 def _convert_cr_to_float(cr: Any) -> float:
@@ -86,21 +352,139 @@ def _convert_cr_to_float(cr: Any) -> float:
         return float(cr)
     # Check if CR is a string and handle fractions or numeric strings
     if isinstance(cr, str):
-        if "/" in cr:
-            try:
-                num, den = map(float, cr.split("/"))
-                return num / den
-            except ValueError:
-                return -1  # Handle malformed fractions
-        try:
-            return float(cr)
-        except ValueError:
-            return -1
+        # Use the pre-computed value for standard Challenge Ratings
+        cr_float = _CR_LOOKUP.get(cr)
+        if cr_float is not None:
+            return cr_float
+        return _parse_cr_str(cr)
 
     # If CR is not a recognized type, return -1
     return -1
 
 
+@cache
+def _parse_cr_str(cr: str) -> float:
+    """Parse a non-standard Challenge Rating string into a float.
+
+    Parameters
+    ----------
+    cr : str
+        The Challenge Rating as a fraction or numeric string.
+
+    Returns
+    -------
+    float
+        The parsed Challenge Rating, or -1 if the string is malformed.
+    """
+    if "/" in cr:
+        try:
+            num, den = map(float, cr.split("/"))
+            return num / den
+        except ValueError:
+            return -1  # Handle malformed fractions
+    try:
+        return float(cr)
+    except ValueError:
+        return -1
+
+
+def _iter_matches(
+    cr_min: Optional[float],
+    cr_max: Optional[float],
+    environment: Optional[str],
+) -> Iterator[Monster]:
+    """Lazily yield the monsters matching the provided filters.
+
+    Parameters
+    ----------
+    cr_min : Optional[float]
+        The minimum Challenge Rating, or None for no lower bound.
+    cr_max : Optional[float]
+        The maximum Challenge Rating, or None for no upper bound.
+    environment : Optional[str]
+        A case-insensitive substring of the environment, or None.
+
+    Yields
+    ------
+    Monster
+        Each matching `Monster`, in the order of the monster data file.
+    """
+    # Load cached monster data and its lookup structures
+    monsters = load_monsters_cached()
+    index = _load_monster_index()
+
+    # Narrow the candidates to the requested CR range using the sorted index
+    candidates: Optional[Iterable[int]] = None
+    if cr_min is not None or cr_max is not None:
+        lo = (
+            bisect_left(index.cr_sorted_values, cr_min)
+            if cr_min is not None
+            else 0
+        )
+        hi = (
+            bisect_right(index.cr_sorted_values, cr_max)
+            if cr_max is not None
+            else len(index.cr_sorted_values)
+        )
+        candidates = index.cr_sorted[lo:hi]
+
+    # Narrow the candidates to monsters found in a matching environment
+    if environment:
+        env_needle = environment.lower()
+        env_matches: Set[int] = set()
+        for env, indices in index.env_index.items():
+            if env_needle in env:
+                env_matches.update(indices)
+        candidates = (
+            env_matches
+            if candidates is None
+            else env_matches.intersection(candidates)
+        )
+
+    # Restore file order so the limit keeps the same monsters as a scan
+    if candidates is None:
+        yield from monsters
+    else:
+        for i in sorted(candidates):
+            yield monsters[i]
+
+
+@lru_cache(maxsize=256)
+def _find_monsters_cached(
+    cr_min: Optional[float],
+    cr_max: Optional[float],
+    environment: Optional[str],
+    limit: int,
+) -> Tuple[Monster, ...]:
+    """Find the monsters matching the given filters, caching the result.
+
+    The monster data never changes while the process runs, so identical
+    requests can reuse the previous answer.
+
+    Parameters
+    ----------
+    cr_min : Optional[float]
+        The minimum Challenge Rating, or None for no lower bound.
+    cr_max : Optional[float]
+        The maximum Challenge Rating, or None for no upper bound.
+    environment : Optional[str]
+        A case-insensitive substring of the environment, or None.
+    limit : int
+        The maximum number of monsters to return.
+
+    Returns
+    -------
+    Tuple[Monster, ...]
+        The matching monsters, in the order of the monster data file.
+    """
+    # Without filters the result is just the head of the catalog
+    if cr_min is None and cr_max is None and not environment:
+        return tuple(load_monsters_cached()[:limit])
+
+    # Stop consuming matches as soon as the limit is reached
+    return tuple(islice(_iter_matches(cr_min, cr_max, environment), limit))
+
+
 def find_monsters(params: MonsterSummonRequest) -> List[Monster]:
     """Find monsters based on the provided parameters.
     This function filters the loaded monster data based on the Challenge Rating
@@ -118,44 +502,18 @@ def find_monsters(params: MonsterSummonRequest) -> List[Monster]:
     List[Monster]
         A list of `Monster` objects that match the specified criteria.
     """
-    # Load cached monster data
-    monsters = load_monsters_cached()
+    return list(
+        _find_monsters_cached(
+            params.cr_min, params.cr_max, params.environment, params.limit
+        )
+    )
 
-    # Initialize an empty list to store the results
-    results = []
-
-    # Iterate through the loaded monster data
-    for monster in monsters:
-        # Dump the monster data to a dictionary
-        monster_data: Dict[str, Any] = monster.model_dump(mode="json")
-        # Convert CR to float for comparison
-        monster_cr_float = _convert_cr_to_float(monster_data.get("cr", -1))
-        # Skip monsters with CR below the minimum specified
-        if params.cr_min is not None and monster_cr_float < params.cr_min:
-            continue
-        # Skip monsters with CR above the maximum specified
-        if params.cr_max is not None and monster_cr_float > params.cr_max:
-            continue
-        # Skip monsters without an environment if one is specified
-        if params.environment:
-            env_match = any(
-                params.environment.lower() in env.lower()
-                for env in monster_data.get("environment", [])
-            )
-            if not env_match:
-                continue
-
-        # Ensure all required fields for Monster model are present or have defaults
-        try:
-            results.append(Monster(**monster_data))
-        except Exception as e:  # Catch Pydantic validation error or others
-            logger.warning(
-                f"Error creating Monster object from data: {monster_data}. Error: {e}"
-            )
-            continue  # Skip this monster if data is incompatible
 
-        # Check if we have reached the limit of results
-        if len(results) >= params.limit:
-            break
+if __name__ == "__main__":
+    # Build through the package module so pickled classes reference it
+    # rather than `__main__`
+    from automated_taskmaster.helpers.monster_summoner import (
+        build_monster_snapshot as _build,
+    )
 
-    return results
+    _build()
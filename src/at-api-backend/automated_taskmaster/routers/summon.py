@@ -1,3 +1,6 @@
+# Standard Library
+import logging
+
 # Third Party
 from fastapi import APIRouter
 from aws_lambda_powertools import Logger
@@ -28,21 +31,24 @@ async def summon_monster_endpoint(
     # Log the request parameters
     logger.info(
         "Summon monster request received.",
-        extra=request_params.model_dump(mode="json"),
+        extra=request_params.model_dump(),
     )
 
     # Find monsters based on the request parameters
     monsters_found = find_monsters(request_params)
 
-    # Log the number of monsters found
-    logger.info(
-        f"Monsters found: {len(monsters_found)}",
-        extra={
-            "monsters": [
-                monster.model_dump(mode="json") for monster in monsters_found
-            ]
-        },
-    )
+    # Log the number of monsters found, and the monsters themselves at DEBUG
+    logger.info(f"Monsters found: {len(monsters_found)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Summoned monsters.",
+            extra={
+                "monsters": [
+                    monster.model_dump(mode="json")
+                    for monster in monsters_found
+                ]
+            },
+        )
 
     return MonsterSummonResponse(
         query_parameters=request_params,
@@ -10,26 +10,47 @@ from aws_lambda_powertools.logging import correlation_paths
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 # Local Modules
-from automated_taskmaster.api import router
+from automated_taskmaster.api import get_api_prefix, routers
+from automated_taskmaster.helpers.monster_summoner import warm_monster_cache
 
 # Initialize a logger
 logger = Logger()
 
-# Get the API prefix from environment variables or default to 'api/v1'
-api_prefix = os.getenv("API_PREFIX", "/api/v1")
-
-# Create a FastAPI application instance
-app = FastAPI(
-    title="Automated Taskmaster API",
-    version="0.1.0",
-    description="Provides TTRPG utilities like monster summoning.",
-    docs_url=f"{api_prefix}/docs",
-    redoc_url=f"{api_prefix}/redoc",
-    openapi_url=f"{api_prefix}/openapi.json",
-)
 
-# Add the API router to the FastAPI app
-app.include_router(router, prefix=api_prefix)
+def create_app() -> FastAPI:
+    """Create the FastAPI application with all API routes mounted.
+
+    Returns
+    -------
+    FastAPI
+        The configured FastAPI application.
+    """
+    # Resolve the API prefix once, when the app is built
+    api_prefix = get_api_prefix()
+
+    # Create a FastAPI application instance
+    app = FastAPI(
+        title="Automated Taskmaster API",
+        version="0.1.0",
+        description="Provides TTRPG utilities like monster summoning.",
+        docs_url=f"{api_prefix}/docs",
+        redoc_url=f"{api_prefix}/redoc",
+        openapi_url=f"{api_prefix}/openapi.json",
+    )
+
+    # Add each API router to the FastAPI app in a single pass
+    for router in routers:
+        app.include_router(router, prefix=api_prefix)
+    return app
+
+
+# Create the FastAPI application
+app = create_app()
+
+# Load the monster data during INIT when the environment is provisioned ahead
+# of traffic; on-demand environments load it on the first request instead
+if os.getenv("AWS_LAMBDA_INITIALIZATION_TYPE") == "provisioned-concurrency":
+    warm_monster_cache()
 
 # Initialize Mangum handler globally
 # This instance will be reused across invocations in a warm Lambda environment.
@@ -4,7 +4,7 @@ from typing import Dict, Any
 # Third Party
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.utilities.typing import LambdaContext
-from ip_authorizer.utils import get_allowed_ip_from_ssm
+from ip_authorizer.utils import get_allowed_ip_from_ssm, is_ip_allowed
 
 # Initialize logger
 logger = Logger()
@@ -16,9 +16,10 @@ def lambda_handler(
 ) -> Dict[str, Any]:
     """Lambda Authorizer for API Gateway HTTP API.
 
-    Validates the source IP of the request against an IP stored in SSM
-    Parameter Store. The API Gateway authorizer cache TTL should be set to 0
-    for this to be checked on every request.
+    Validates the source IP of the request against the IP, or comma-separated
+    list of IPs and CIDR networks, stored in SSM Parameter Store. The API
+    Gateway authorizer cache TTL should be set to 0 for this to be checked on
+    every request.
 
     Parameters
     ----------
@@ -33,7 +34,7 @@ def lambda_handler(
     -------
     Dict[str, Any]
         A dictionary indicating whether the request is authorized or not.
-        If the source IP matches the allowed IP from SSM, returns
+        If the source IP matches an allowed IP from SSM, returns
         `{"isAuthorized": True}`, otherwise returns `{"isAuthorized": False}`.
     """
     logger.info("IP Authorizer invoked.")
@@ -60,14 +61,14 @@ def lambda_handler(
         )
         return {"isAuthorized": False}
 
-    # Log the allowed IP for debugging purposes
-    if source_ip == allowed_ip:
+    # Check the source IP against the allowed IP(s) from SSM
+    if is_ip_allowed(source_ip, allowed_ip):
         logger.info(
             f"Authorization successful for source IP: {source_ip} "
             f"(matches SSM value: {allowed_ip})"
         )
         return {"isAuthorized": True}
-    # If the source IP does not match the allowed IP, deny the request
+    # If the source IP does not match an allowed IP, deny the request
     else:
         logger.warning(
             f"Authorization denied. Source IP {source_ip} does not match "
@@ -1,6 +1,15 @@
 # Standard Library
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import FrozenSet, NamedTuple, Optional, Tuple, Union
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
 
 # Third Party
 import boto3
@@ -31,16 +40,18 @@ def get_ssm_client() -> Optional[boto3.client]:
 
 
 def get_allowed_ip_from_ssm() -> Optional[str]:
-    """Fetches the allowed IP address from SSM Parameter Store.
+    """Fetches the allowed IP value from SSM Parameter Store.
 
-    This function retrieves the IP address stored in the SSM parameter defined
-    by the environment variable `HOME_IP_SSM_PARAMETER_NAME`. It returns the IP
-    address as a string if found, otherwise returns None.
+    This function retrieves the value stored in the SSM parameter defined by
+    the environment variable `HOME_IP_SSM_PARAMETER_NAME`. The value is either
+    a single IP address or a comma-separated list of IP addresses and CIDR
+    networks, e.g. `203.0.113.7,198.51.100.0/24`. It returns the raw value as
+    a string if found, otherwise returns None.
 
     Returns
     -------
     Optional[str]
-        The allowed IP address as a string if found, otherwise None.
+        The allowed IP value as a string if found, otherwise None.
     """
     ssm_client = get_ssm_client()
     if not ssm_client or not HOME_IP_SSM_PARAMETER_NAME:
@@ -48,7 +59,7 @@ def get_allowed_ip_from_ssm() -> Optional[str]:
         return None
     try:
         logger.debug(
-            f"Fetching IP from SSM parameter: {HOME_IP_SSM_PARAMETER_NAME}"
+            "Fetching IP from SSM parameter: %s", HOME_IP_SSM_PARAMETER_NAME
         )
         parameter = ssm_client.get_parameter(
             Name=HOME_IP_SSM_PARAMETER_NAME, WithDecryption=False
@@ -71,3 +82,83 @@ def get_allowed_ip_from_ssm() -> Optional[str]:
         # Catch any other unexpected errors
         logger.exception(f"Unexpected error fetching IP from SSM: {e}")
         return None
+
+
+class AllowedIPs(NamedTuple):
+    """Parsed allowlist of exact IP addresses and CIDR networks."""
+
+    hosts: FrozenSet[Union[IPv4Address, IPv6Address]]
+    networks: Tuple[Union[IPv4Network, IPv6Network], ...]
+
+
+@lru_cache(maxsize=8)
+def parse_allowed_ips(allowed_ips: str) -> AllowedIPs:
+    """Parses a comma-separated SSM parameter value into an IP allowlist.
+
+    The parameter value rarely changes, so the parsed allowlist is cached by
+    the raw value and reused across invocations. Entries that are neither an
+    IP address nor a CIDR network, including CIDR networks with host bits set
+    such as `203.0.113.7/8`, are logged and ignored so a typo never widens the
+    allowlist.
+
+    Parameters
+    ----------
+    allowed_ips : str
+        The SSM parameter value, either a single IP address or a
+        comma-separated list of IP addresses and CIDR networks.
+
+    Returns
+    -------
+    AllowedIPs
+        The allowed IP addresses and networks.
+    """
+    hosts = set()
+    networks = []
+    for entry in allowed_ips.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            if "/" in entry:
+                networks.append(ip_network(entry, strict=True))
+            else:
+                hosts.add(ip_address(entry))
+        except ValueError:
+            logger.warning("Ignoring invalid allowed IP entry: %s", entry)
+    logger.info(
+        "Parsed IP allowlist with hosts: %s and networks: %s",
+        sorted(str(host) for host in hosts),
+        [str(network) for network in networks],
+    )
+    return AllowedIPs(hosts=frozenset(hosts), networks=tuple(networks))
+
+
+def is_ip_allowed(source_ip: str, allowed_ips: str) -> bool:
+    """Checks whether a source IP is covered by the allowed IPs value.
+
+    Parameters
+    ----------
+    source_ip : str
+        The IP address the request came from.
+    allowed_ips : str
+        The SSM parameter value, either a single IP address or a
+        comma-separated list of IP addresses and CIDR networks.
+
+    Returns
+    -------
+    bool
+        True if the source IP matches an allowed IP address or falls within
+        an allowed network, otherwise False.
+    """
+    try:
+        ip = ip_address(source_ip)
+    except ValueError:
+        return False
+
+    allowed = parse_allowed_ips(allowed_ips)
+    if ip in allowed.hosts:
+        return True
+    return any(
+        ip.version == network.version and ip in network
+        for network in allowed.networks
+    )
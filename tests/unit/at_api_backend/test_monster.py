@@ -1,9 +1,9 @@
 # Standard Library
-from typing import List
+from typing import List, Union
 
 # Third Party
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 # First Party
 from automated_taskmaster.models.monster import (
@@ -12,6 +12,47 @@ from automated_taskmaster.models.monster import (
     MonsterSummonResponse,
 )
 
+# Keep these tests on one worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group(name="monster_models")
+
+# Validator for round-tripping dumped requests, built once for the module
+_REQUEST_ADAPTER = TypeAdapter(MonsterSummonRequest)
+
+# Default request for tests where the request is not under test
+_EMPTY_REQ = MonsterSummonRequest.model_construct()
+
+
+def _make_monster(**kwargs) -> Monster:
+    """Build a trusted Monster without running validation."""
+    return Monster.model_construct(**kwargs)
+
+
+# Trusted monsters shared by the response and integration tests
+_GOBLIN = _make_monster(
+    name="Goblin",
+    cr=0.25,
+    environment=["forest", "hills"],
+    source="Monster Manual"
+)
+_ORC = _make_monster(
+    name="Orc",
+    cr=1.0,
+    environment=["mountains"],
+    source="Monster Manual"
+)
+_WOLF = _make_monster(
+    name="Wolf",
+    cr="0.25",
+    environment=["forest", "grassland"],
+    source="Monster Manual"
+)
+_BEAR = _make_monster(
+    name="Brown Bear",
+    cr=1.0,
+    environment=["forest"],
+    source="Monster Manual"
+)
+
 
 class TestMonsterSummonRequest:
     """Test cases for MonsterSummonRequest model."""
@@ -49,23 +90,15 @@ class TestMonsterSummonRequest:
         assert request.environment == environment
         assert request.limit == limit
 
-    @pytest.mark.parametrize("cr_min", [0, 0.0, 0.5, 1.0, 10.5])
-    def test_cr_min_valid_values(self, cr_min: float) -> None:
-        """Test MonsterSummonRequest with valid cr_min values."""
+    @pytest.mark.parametrize("field", ["cr_min", "cr_max"])
+    @pytest.mark.parametrize("value", [0, 0.0, 0.5, 1.0, 10.5])
+    def test_cr_bounds_valid_values(self, field: str, value: float) -> None:
+        """Test MonsterSummonRequest with valid cr_min/cr_max values."""
         # Arrange & Act
-        request = MonsterSummonRequest(cr_min=cr_min)
+        request = MonsterSummonRequest(**{field: value})
 
         # Assert
-        assert request.cr_min == cr_min
-
-    @pytest.mark.parametrize("cr_max", [0, 0.0, 0.5, 1.0, 10.5])
-    def test_cr_max_valid_values(self, cr_max: float) -> None:
-        """Test MonsterSummonRequest with valid cr_max values."""
-        # Arrange & Act
-        request = MonsterSummonRequest(cr_max=cr_max)
-
-        # Assert
-        assert request.cr_max == cr_max
+        assert getattr(request, field) == value
 
     @pytest.mark.parametrize("limit", [1, 25, 50])
     def test_limit_valid_values(self, limit: int) -> None:
@@ -76,23 +109,18 @@ class TestMonsterSummonRequest:
         # Assert
         assert request.limit == limit
 
-    @pytest.mark.parametrize("cr_min", [-1, -0.1, -10])
-    def test_cr_min_invalid_negative_values(self, cr_min: float) -> None:
-        """Test MonsterSummonRequest validation fails for negative cr_min."""
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
-            MonsterSummonRequest(cr_min=cr_min)
-
-        assert "greater than or equal to 0" in str(exc_info.value)
-
-    @pytest.mark.parametrize("cr_max", [-1, -0.1, -10])
-    def test_cr_max_invalid_negative_values(self, cr_max: float) -> None:
-        """Test MonsterSummonRequest validation fails for negative cr_max."""
+    @pytest.mark.parametrize("field", ["cr_min", "cr_max"])
+    @pytest.mark.parametrize("value", [-1, -0.1, -10])
+    def test_cr_bounds_invalid_negative_values(
+        self, field: str, value: float
+    ) -> None:
+        """Test validation fails for negative cr_min/cr_max values."""
         # Arrange & Act & Assert
         with pytest.raises(ValidationError) as exc_info:
-            MonsterSummonRequest(cr_max=cr_max)
+            MonsterSummonRequest(**{field: value})
 
-        assert "greater than or equal to 0" in str(exc_info.value)
+        error_message = str(exc_info.value)
+        assert "greater than or equal to 0" in error_message
 
     @pytest.mark.parametrize("limit", [0, -1, 51, 100])
     def test_limit_invalid_values(self, limit: int) -> None:
@@ -109,78 +137,17 @@ class TestMonsterSummonRequest:
 class TestMonster:
     """Test cases for Monster model."""
 
-    def test_create_monster_with_float_cr(self) -> None:
-        """Test creating Monster with float challenge rating."""
-        # Arrange
-        name = "Goblin"
-        cr = 0.25
-        environment = ["forest", "hills"]
-        source = "Monster Manual"
-
-        # Act
-        monster = Monster(
-            name=name,
-            cr=cr,
-            environment=environment,
-            source=source
-        )
-
-        # Assert
-        assert monster.name == name
-        assert monster.cr == cr
-        assert monster.environment == environment
-        assert monster.source == source
-
-    def test_create_monster_with_string_cr(self) -> None:
-        """Test creating Monster with string challenge rating."""
-        # Arrange
-        name = "Ancient Dragon"
-        cr = "30"
-        environment = ["mountain", "cave"]
-        source = "Monster Manual"
-
-        # Act
-        monster = Monster(
-            name=name,
-            cr=cr,
-            environment=environment,
-            source=source
-        )
-
-        # Assert
-        assert monster.name == name
-        assert monster.cr == cr
-        assert monster.environment == environment
-        assert monster.source == source
-
-    def test_create_monster_with_single_environment(self) -> None:
-        """Test creating Monster with single environment in list."""
-        # Arrange
-        name = "Fire Elemental"
-        cr = 5.0
-        environment = ["desert"]
-        source = "Monster Manual"
-
-        # Act
-        monster = Monster(
-            name=name,
-            cr=cr,
-            environment=environment,
-            source=source
-        )
-
-        # Assert
-        assert monster.name == name
-        assert monster.cr == cr
-        assert monster.environment == environment
-        assert monster.source == source
-
-    def test_create_monster_with_multiple_environments(self) -> None:
-        """Test creating Monster with multiple environments."""
+    @pytest.mark.parametrize("name,cr,environment", [
+        ("Goblin", 0.25, ["forest", "hills"]),
+        ("Ancient Dragon", "30", ["mountain", "cave"]),
+        ("Fire Elemental", 5.0, ["desert"]),
+        ("Owlbear", 3.0, ["forest", "grassland", "hill"]),
+    ])
+    def test_create_monster_valid(
+        self, name: str, cr: Union[float, str], environment: List[str]
+    ) -> None:
+        """Test creating Monster with float/string CRs and environments."""
         # Arrange
-        name = "Owlbear"
-        cr = 3.0
-        environment = ["forest", "grassland", "hill"]
         source = "Monster Manual"
 
         # Act
@@ -197,33 +164,30 @@ class TestMonster:
         assert monster.environment == environment
         assert monster.source == source
 
-    def test_monster_missing_required_fields(self) -> None:
-        """Test Monster validation fails when required fields are missing."""
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
-            Monster()
-
-        error_message = str(exc_info.value)
-        assert "name" in error_message
-        assert "cr" in error_message
-        assert "environment" in error_message
-        assert "source" in error_message
-
-    @pytest.mark.parametrize("missing_field,field_value", [
-        ("name", {"cr": 1.0, "environment": ["forest"], "source": "MM"}),
-        ("cr", {"name": "Goblin", "environment": ["forest"], "source": "MM"}),
-        ("environment", {"name": "Goblin", "cr": 1.0, "source": "MM"}),
-        ("source", {"name": "Goblin", "cr": 1.0, "environment": ["forest"]}),
+    @pytest.mark.parametrize("missing_fields,field_value", [
+        (["name", "cr", "environment", "source"], {}),
+        (["name"], {"cr": 1.0, "environment": ["forest"], "source": "MM"}),
+        (
+            ["cr"],
+            {"name": "Goblin", "environment": ["forest"], "source": "MM"},
+        ),
+        (["environment"], {"name": "Goblin", "cr": 1.0, "source": "MM"}),
+        (
+            ["source"],
+            {"name": "Goblin", "cr": 1.0, "environment": ["forest"]},
+        ),
     ])
-    def test_monster_missing_individual_required_fields(
-        self, missing_field: str, field_value: dict
+    def test_monster_missing_required_fields(
+        self, missing_fields: List[str], field_value: dict
     ) -> None:
-        """Test Monster validation fails for each missing required field."""
+        """Test Monster validation fails when required fields are missing."""
         # Arrange & Act & Assert
         with pytest.raises(ValidationError) as exc_info:
             Monster(**field_value)
 
-        assert missing_field in str(exc_info.value)
+        error_message = str(exc_info.value)
+        for missing_field in missing_fields:
+            assert missing_field in error_message
 
 
 class TestMonsterSummonResponse:
@@ -232,7 +196,7 @@ class TestMonsterSummonResponse:
     def test_create_response_with_empty_monsters(self) -> None:
         """Test creating MonsterSummonResponse with empty monster list."""
         # Arrange
-        query_parameters = MonsterSummonRequest()
+        query_parameters = _EMPTY_REQ
         summoned_monsters: List[Monster] = []
         count = 0
 
@@ -251,17 +215,12 @@ class TestMonsterSummonResponse:
     def test_create_response_with_single_monster(self) -> None:
         """Test creating MonsterSummonResponse with single monster."""
         # Arrange
-        query_parameters = MonsterSummonRequest(
+        query_parameters = MonsterSummonRequest.model_construct(
             cr_min=1.0,
             cr_max=3.0,
             environment="forest"
         )
-        monster = Monster(
-            name="Goblin",
-            cr=0.25,
-            environment=["forest", "hills"],
-            source="Monster Manual"
-        )
+        monster = _GOBLIN
         summoned_monsters = [monster]
         count = 1
 
@@ -282,21 +241,8 @@ class TestMonsterSummonResponse:
     def test_create_response_with_multiple_monsters(self) -> None:
         """Test creating MonsterSummonResponse with multiple monsters."""
         # Arrange
-        query_parameters = MonsterSummonRequest(limit=2)
-        monsters = [
-            Monster(
-                name="Goblin",
-                cr=0.25,
-                environment=["forest"],
-                source="Monster Manual"
-            ),
-            Monster(
-                name="Orc",
-                cr=1.0,
-                environment=["mountains"],
-                source="Monster Manual"
-            )
-        ]
+        query_parameters = MonsterSummonRequest.model_construct(limit=2)
+        monsters = [_GOBLIN, _ORC]
         count = 2
 
         # Act
@@ -329,11 +275,11 @@ class TestMonsterSummonResponse:
             "count": 0
         }),
         ("summoned_monsters", {
-            "query_parameters": MonsterSummonRequest(),
+            "query_parameters": _EMPTY_REQ,
             "count": 0
         }),
         ("count", {
-            "query_parameters": MonsterSummonRequest(),
+            "query_parameters": _EMPTY_REQ,
             "summoned_monsters": []
         }),
     ])
@@ -345,7 +291,8 @@ class TestMonsterSummonResponse:
         with pytest.raises(ValidationError) as exc_info:
             MonsterSummonResponse(**field_value)
 
-        assert missing_field in str(exc_info.value)
+        error_message = str(exc_info.value)
+        assert missing_field in error_message
 
 
 class TestModelIntegration:
@@ -354,33 +301,14 @@ class TestModelIntegration:
     def test_complete_workflow(self) -> None:
         """Test complete workflow from request to response."""
         # Arrange
-        request = MonsterSummonRequest(
+        request = MonsterSummonRequest.model_construct(
             cr_min=0.0,
             cr_max=2.0,
             environment="forest",
             limit=3
         )
 
-        monsters = [
-            Monster(
-                name="Goblin",
-                cr=0.25,
-                environment=["forest", "hills"],
-                source="Monster Manual"
-            ),
-            Monster(
-                name="Wolf",
-                cr="0.25",
-                environment=["forest", "grassland"],
-                source="Monster Manual"
-            ),
-            Monster(
-                name="Brown Bear",
-                cr=1.0,
-                environment=["forest"],
-                source="Monster Manual"
-            )
-        ]
+        monsters = [_GOBLIN, _WOLF, _BEAR]
 
         # Act
         response = MonsterSummonResponse(
@@ -422,7 +350,9 @@ class TestModelIntegration:
 
         # Act - Convert to dict and back
         request_dict = original_request.model_dump()
-        reconstructed_request = MonsterSummonRequest(**request_dict)        # Assert
+        reconstructed_request = _REQUEST_ADAPTER.validate_python(request_dict)
+
+        # Assert
         assert reconstructed_request.cr_min == original_request.cr_min
         assert reconstructed_request.cr_max == original_request.cr_max
         assert reconstructed_request.environment == original_request.environment
@@ -0,0 +1,353 @@
+# Standard Library
+import pickle
+from pathlib import Path
+from typing import Any, List
+
+# Third Party
+import pytest
+
+# First Party
+from automated_taskmaster.models.monster import Monster, MonsterSummonRequest
+from automated_taskmaster.helpers import monster_summoner
+from automated_taskmaster.helpers.monster_summoner import (
+    _convert_cr_to_float,
+    build_monster_snapshot,
+    find_monsters,
+    load_monsters_cached,
+)
+
+
+def _names(monsters: List[Monster]) -> List[str]:
+    """Return the names of the given monsters, preserving order."""
+    return [monster.name for monster in monsters]
+
+
+class TestConvertCrToFloat:
+    """Test cases for the _convert_cr_to_float helper."""
+
+    @pytest.mark.parametrize(
+        "cr,expected",
+        [
+            ("1/8", 0.125),
+            ("1/4", 0.25),
+            ("1/2", 0.5),
+            ("5", 5.0),
+            ("0.25", 0.25),
+            (2, 2.0),
+            (0.5, 0.5),
+            ("not-a-cr", -1),
+            ("a/b", -1),
+            (None, -1),
+        ],
+    )
+    def test_convert_cr_to_float(self, cr: Any, expected: float) -> None:
+        """Test converting the supported CR formats to floats."""
+        # Arrange & Act
+        result = _convert_cr_to_float(cr)
+
+        # Assert
+        assert result == expected
+
+
+class TestFindMonsters:
+    """Test cases for filtering the bundled monster data."""
+
+    def test_load_monsters_cached_returns_monsters(self) -> None:
+        """Test the bundled data file loads into Monster objects."""
+        # Arrange & Act
+        monsters = load_monsters_cached()
+
+        # Assert
+        assert len(monsters) == 10
+        assert all(isinstance(monster, Monster) for monster in monsters)
+
+    def test_bundled_data_passes_validation(self) -> None:
+        """Test the bundled data file validates against the Monster model."""
+        # Arrange & Act
+        validated = monster_summoner._read_monster_data(validate=True)
+
+        # Assert
+        assert validated == load_monsters_cached()
+
+    def test_validation_skips_invalid_monsters(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that validated loads drop monsters that fail validation."""
+        # Arrange
+        data_file = tmp_path / "monsters.json"
+        data_file.write_text(
+            '[{"name": "Goblin", "cr": "1/4", "environment": ["forest"],'
+            ' "source": "SRD"},'
+            ' {"name": "Nameless", "cr": {"bad": 1}}]'
+        )
+        monkeypatch.setattr(
+            monster_summoner, "_MONSTER_DATA_FILE", str(data_file)
+        )
+
+        # Act
+        result = monster_summoner._read_monster_data(validate=True)
+
+        # Assert
+        assert _names(result) == ["Goblin"]
+
+    def test_malformed_json_fallback_loads_no_monsters(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a JSON row missing a field falls back to no monsters."""
+        # Arrange
+        data_file = tmp_path / "monsters.json"
+        data_file.write_text(
+            '[{"name": "Goblin", "cr": "1/4", "source": "SRD"}]'
+        )
+        monkeypatch.setattr(
+            monster_summoner, "_MONSTER_DATA_FILE", str(data_file)
+        )
+        monkeypatch.setattr(
+            monster_summoner,
+            "_MONSTER_SNAPSHOT_FILE",
+            str(tmp_path / "missing.pkl"),
+        )
+
+        # Act
+        monsters, index = monster_summoner._load_monster_catalog.__wrapped__()
+
+        # Assert
+        assert monsters == []
+        assert index == monster_summoner._build_monster_index([])
+
+    def test_find_monsters_without_filters(self) -> None:
+        """Test that all monsters are returned in file order by default."""
+        # Arrange
+        params = MonsterSummonRequest()
+
+        # Act
+        result = find_monsters(params)
+
+        # Assert
+        assert _names(result) == _names(load_monsters_cached())
+
+    def test_find_monsters_without_filters_respects_limit(self) -> None:
+        """Test that an unfiltered request returns the first monsters."""
+        # Arrange
+        params = MonsterSummonRequest(limit=3)
+
+        # Act
+        result = find_monsters(params)
+
+        # Assert
+        assert _names(result) == _names(load_monsters_cached()[:3])
+        assert result is not load_monsters_cached()
+
+    def test_find_monsters_by_cr_range(self) -> None:
+        """Test filtering monsters by an inclusive CR range."""
+        # Arrange
+        params = MonsterSummonRequest(cr_min=0.25, cr_max=0.5)
+
+        # Act
+        result = find_monsters(params)
+
+        # Assert
+        assert _names(result) == [
+            "Goblin",
+            "Orc",
+            "Giant Spider",
+            "Zombie",
+            "Skeleton",
+        ]
+
+    def test_find_monsters_with_inverted_cr_range(self) -> None:
+        """Test that a CR range with min above max matches nothing."""
+        # Arrange
+        params = MonsterSummonRequest(cr_min=2.0, cr_max=1.0)
+
+        # Act
+        result = find_monsters(params)
+
+        # Assert
+        assert result == []
+
+    def test_find_monsters_by_environment_is_case_insensitive(self) -> None:
+        """Test filtering monsters by environment ignores case."""
+        # Arrange
+        params = MonsterSummonRequest(environment="FOREST")
+
+        # Act
+        result = find_monsters(params)
+
+        # Assert
+        assert _names(result) == ["Goblin", "Kobold", "Troll", "Giant Spider"]
+
+    def test_find_monsters_by_environment_substring(self) -> None:
+        """Test that the environment filter matches substrings."""
+        # Arrange
+        params = MonsterSummonRequest(environment="urb")
+
+        # Act
+        result = find_monsters(params)
+
+        # Assert
+        assert _names(result) == ["Zombie", "Skeleton", "Giant Rat", "Bandit"]
+
+    def test_find_monsters_by_cr_and_environment(self) -> None:
+        """Test combining the CR and environment filters."""
+        # Arrange
+        params = MonsterSummonRequest(cr_min=1, environment="mountain")
+
+        # Act
+        result = find_monsters(params)
+
+        # Assert
+        assert _names(result) == ["Troll", "Dragon Wyrmling"]
+
+    def test_find_monsters_respects_limit(self) -> None:
+        """Test that no more than `limit` monsters are returned."""
+        # Arrange
+        params = MonsterSummonRequest(cr_max=1, limit=2)
+
+        # Act
+        result = find_monsters(params)
+
+        # Assert
+        assert _names(result) == ["Goblin", "Orc"]
+
+    def test_find_monsters_caches_repeated_queries(self) -> None:
+        """Test that a repeated query is served from the result cache."""
+        # Arrange
+        params = MonsterSummonRequest(cr_min=0.5, environment="grass")
+        first = find_monsters(params)
+        hits = monster_summoner._find_monsters_cached.cache_info().hits
+
+        # Act
+        second = find_monsters(params)
+
+        # Assert
+        assert second == first
+        assert second is not first
+        assert (
+            monster_summoner._find_monsters_cached.cache_info().hits
+            == hits + 1
+        )
+
+    def test_find_monsters_no_matches(self) -> None:
+        """Test that an unmatched environment returns an empty list."""
+        # Arrange
+        params = MonsterSummonRequest(environment="desert")
+
+        # Act
+        result = find_monsters(params)
+
+        # Assert
+        assert result == []
+
+
+class TestMonsterSnapshot:
+    """Test cases for the pickled monster snapshot."""
+
+    def test_build_and_load_snapshot(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a built snapshot loads back the same monsters."""
+        # Arrange
+        snapshot_file = tmp_path / "monsters.pkl"
+        monkeypatch.setattr(
+            monster_summoner, "_MONSTER_SNAPSHOT_FILE", str(snapshot_file)
+        )
+
+        # Act
+        build_monster_snapshot(str(snapshot_file))
+        snapshot = monster_summoner._load_monster_snapshot()
+
+        # Assert
+        assert snapshot == (
+            load_monsters_cached(),
+            monster_summoner._load_monster_index(),
+        )
+
+    def test_load_missing_snapshot(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a missing snapshot returns None."""
+        # Arrange
+        monkeypatch.setattr(
+            monster_summoner,
+            "_MONSTER_SNAPSHOT_FILE",
+            str(tmp_path / "missing.pkl"),
+        )
+
+        # Act
+        snapshot = monster_summoner._load_monster_snapshot()
+
+        # Assert
+        assert snapshot is None
+
+    def test_load_outdated_snapshot(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a snapshot from another version returns None."""
+        # Arrange
+        snapshot_file = tmp_path / "monsters.pkl"
+        snapshot_file.write_bytes(
+            pickle.dumps(
+                (
+                    monster_summoner._SNAPSHOT_VERSION - 1,
+                    monster_summoner._monster_data_stamp(),
+                    [],
+                    None,
+                ),
+                protocol=5,
+            )
+        )
+        monkeypatch.setattr(
+            monster_summoner, "_MONSTER_SNAPSHOT_FILE", str(snapshot_file)
+        )
+
+        # Act
+        snapshot = monster_summoner._load_monster_snapshot()
+
+        # Assert
+        assert snapshot is None
+
+    def test_load_snapshot_after_data_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that editing the JSON data invalidates a built snapshot."""
+        # Arrange
+        data_file = tmp_path / "monsters.json"
+        data_file.write_bytes(
+            Path(monster_summoner._MONSTER_DATA_FILE).read_bytes()
+        )
+        snapshot_file = tmp_path / "monsters.pkl"
+        monkeypatch.setattr(
+            monster_summoner, "_MONSTER_DATA_FILE", str(data_file)
+        )
+        monkeypatch.setattr(
+            monster_summoner, "_MONSTER_SNAPSHOT_FILE", str(snapshot_file)
+        )
+        build_monster_snapshot(str(snapshot_file))
+        data_file.write_text(
+            '[{"name": "Goblin", "cr": "1/4", "environment": ["forest"],'
+            ' "source": "SRD"}]'
+        )
+
+        # Act
+        snapshot = monster_summoner._load_monster_snapshot()
+
+        # Assert
+        assert snapshot is None
+
+    def test_load_corrupt_snapshot(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unreadable snapshot returns None."""
+        # Arrange
+        snapshot_file = tmp_path / "monsters.pkl"
+        snapshot_file.write_bytes(b"not a pickle")
+        monkeypatch.setattr(
+            monster_summoner, "_MONSTER_SNAPSHOT_FILE", str(snapshot_file)
+        )
+
+        # Act
+        snapshot = monster_summoner._load_monster_snapshot()
+
+        # Assert
+        assert snapshot is None
@@ -1,5 +1,7 @@
 # Standard Library
-from typing import Generator, Any, Dict
+import copy
+from types import SimpleNamespace
+from typing import Generator, Any, Dict, Optional
 from unittest.mock import MagicMock, patch
 
 # Third Party
@@ -9,9 +11,13 @@ import pytest
 from tests.conftest import import_handler
 
 
-@pytest.fixture
+# Keep these tests on one worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group(name="ip_authorizer")
+
+
+@pytest.fixture(scope="session")
 def handler_module():
-    """Import and return the at-ip-authorizer handler module."""
+    """Import and return the at-ip-authorizer handler module once."""
     return import_handler("at-ip-authorizer")
 
 
@@ -33,22 +39,25 @@ def mock_get_allowed_ip(
         yield mock_get_ip
 
 
-@pytest.fixture
-def sample_lambda_context() -> MagicMock:
-    """Return a sample Lambda context object."""
-    context = MagicMock()
-    context.function_name = "test_authorizer_lambda"
-    context.memory_limit_in_mb = 256
-    context.aws_request_id = "test-authorizer-request-id"
-    context.invoked_function_arn = (
-        "arn:aws:lambda:us-east-1:123456789012:function:test_authorizer"
+@pytest.fixture(scope="module")
+def sample_lambda_context() -> SimpleNamespace:
+    """Return a sample Lambda context object, shared by the module."""
+    return SimpleNamespace(
+        function_name="test_authorizer_lambda",
+        memory_limit_in_mb=256,
+        aws_request_id="test-authorizer-request-id",
+        invoked_function_arn=(
+            "arn:aws:lambda:us-east-1:123456789012:function:test_authorizer"
+        ),
     )
-    return context
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_api_gateway_event() -> Dict[str, Any]:
-    """Return a sample API Gateway HTTP API event."""
+    """Return a sample API Gateway HTTP API event, shared by the module.
+
+    Tests that modify the event must work on a deep copy.
+    """
     return {
         "version": "2.0",
         "type": "REQUEST",
@@ -83,6 +92,21 @@ def sample_api_gateway_event() -> Dict[str, Any]:
     }
 
 
+def _assert_denied(
+    result: Dict[str, Any],
+    mock_logger: MagicMock,
+    *,
+    warning: Optional[str] = None,
+    error: Optional[str] = None,
+) -> None:
+    """Assert the request was denied and the reason logged exactly once."""
+    assert result == {"isAuthorized": False}
+    if warning is not None:
+        mock_logger.warning.assert_called_once_with(warning)
+    if error is not None:
+        mock_logger.error.assert_called_once_with(error)
+
+
 class TestIPAuthorizerHandler:
     """Test class for the IP authorizer handler."""
 
@@ -92,7 +116,7 @@ class TestIPAuthorizerHandler:
         mock_logger: MagicMock,
         mock_get_allowed_ip: MagicMock,
         sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
+        sample_lambda_context: SimpleNamespace,
     ):
         """Test successful authorization with matching IP address."""
         # Arrange
@@ -120,7 +144,7 @@ class TestIPAuthorizerHandler:
         mock_logger: MagicMock,
         mock_get_allowed_ip: MagicMock,
         sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
+        sample_lambda_context: SimpleNamespace,
     ):
         """Test authorization denied when source IP doesn't match allowed IP."""
         # Arrange
@@ -134,79 +158,44 @@ class TestIPAuthorizerHandler:
         )
 
         # Assert
-        assert result == {"isAuthorized": False}
-        mock_logger.warning.assert_called_once_with(
-            f"Authorization denied. Source IP {source_ip} does not match "
-            f"allowed IP {allowed_ip} from SSM."
+        _assert_denied(
+            result,
+            mock_logger,
+            warning=(
+                f"Authorization denied. Source IP {source_ip} does not match "
+                f"allowed IP {allowed_ip} from SSM."
+            ),
         )
         mock_get_allowed_ip.assert_called_once()
 
+    @pytest.mark.parametrize(
+        "event",
+        [
+            {},
+            {"requestContext": {}},
+            {"requestContext": {"http": {}}},
+            {"requestContext": {"http": {"sourceIp": None}}},
+            {"requestContext": {"http": {"sourceIp": ""}}},
+        ],
+        ids=["no_ctx", "no_http", "no_ip", "none_ip", "empty_ip"],
+    )
     def test_lambda_handler_denied_missing_source_ip(
         self,
         handler_module: MagicMock,
         mock_logger: MagicMock,
         mock_get_allowed_ip: MagicMock,
-        sample_lambda_context: MagicMock,
-    ):
-        """Test authorization denied when source IP is missing from event."""
-        # Arrange
-        event_without_source_ip = {"requestContext": {"http": {}}}
-
-        # Act
-        result = handler_module.lambda_handler(
-            event_without_source_ip, sample_lambda_context
-        )
-
-        # Assert
-        assert result == {"isAuthorized": False}
-        mock_logger.warning.assert_called_once_with(
-            "Source IP not found in the event. Denying request."
-        )
-        mock_get_allowed_ip.assert_not_called()
-
-    def test_lambda_handler_denied_missing_request_context(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        mock_get_allowed_ip: MagicMock,
-        sample_lambda_context: MagicMock,
+        sample_lambda_context: SimpleNamespace,
+        event: Dict[str, Any],
     ):
-        """Test authorization denied when requestContext is missing."""
-        # Arrange
-        event_without_context = {}
-
+        """Test authorization denied when the event has no usable source IP."""
         # Act
-        result = handler_module.lambda_handler(
-            event_without_context, sample_lambda_context
-        )
+        result = handler_module.lambda_handler(event, sample_lambda_context)
 
         # Assert
-        assert result == {"isAuthorized": False}
-        mock_logger.warning.assert_called_once_with(
-            "Source IP not found in the event. Denying request."
-        )
-        mock_get_allowed_ip.assert_not_called()
-
-    def test_lambda_handler_denied_missing_http_context(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        mock_get_allowed_ip: MagicMock,
-        sample_lambda_context: MagicMock,
-    ):
-        """Test authorization denied when http context is missing."""
-        # Arrange
-        event_without_http = {"requestContext": {}}
-
-        # Act
-        result = handler_module.lambda_handler(
-            event_without_http, sample_lambda_context
-        )
-
-        # Assert
-        assert result == {"isAuthorized": False}
-        mock_logger.warning.assert_called_once_with(
-            "Source IP not found in the event. Denying request."
+        _assert_denied(
+            result,
+            mock_logger,
+            warning="Source IP not found in the event. Denying request.",
         )
         mock_get_allowed_ip.assert_not_called()
 
@@ -216,7 +205,7 @@ class TestIPAuthorizerHandler:
         mock_logger: MagicMock,
         mock_get_allowed_ip: MagicMock,
         sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
+        sample_lambda_context: SimpleNamespace,
     ):
         """Test authorization denied when SSM parameter retrieval fails."""
         # Arrange
@@ -229,11 +218,12 @@ class TestIPAuthorizerHandler:
         )
 
         # Assert
-        assert result == {"isAuthorized": False}
-        mock_logger.append_keys.assert_called_once_with(source_ip=source_ip)
-        mock_logger.error.assert_called_once_with(
-            "Could not retrieve allowed IP from SSM. Denying request."
+        _assert_denied(
+            result,
+            mock_logger,
+            error="Could not retrieve allowed IP from SSM. Denying request.",
         )
+        mock_logger.append_keys.assert_called_once_with(source_ip=source_ip)
         mock_get_allowed_ip.assert_called_once()
 
     def test_lambda_handler_denied_empty_allowed_ip(
@@ -242,7 +232,7 @@ class TestIPAuthorizerHandler:
         mock_logger: MagicMock,
         mock_get_allowed_ip: MagicMock,
         sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
+        sample_lambda_context: SimpleNamespace,
     ):
         """Test authorization denied when allowed IP is empty string."""
         # Arrange
@@ -255,9 +245,10 @@ class TestIPAuthorizerHandler:
         )
 
         # Assert
-        assert result == {"isAuthorized": False}
-        mock_logger.error.assert_called_once_with(
-            "Could not retrieve allowed IP from SSM. Denying request."
+        _assert_denied(
+            result,
+            mock_logger,
+            error="Could not retrieve allowed IP from SSM. Denying request.",
         )
 
     @pytest.mark.parametrize(
@@ -279,33 +270,70 @@ class TestIPAuthorizerHandler:
         mock_logger: MagicMock,
         mock_get_allowed_ip: MagicMock,
         sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
+        sample_lambda_context: SimpleNamespace,
         source_ip: str,
         allowed_ip: str,
         should_authorize: bool,
     ):
         """Test various IP authorization scenarios with parameterized inputs."""
         # Arrange
-        sample_api_gateway_event["requestContext"]["http"][
-            "sourceIp"
-        ] = source_ip
+        event = copy.deepcopy(sample_api_gateway_event)
+        event["requestContext"]["http"]["sourceIp"] = source_ip
         mock_get_allowed_ip.return_value = allowed_ip
 
         # Act
-        result = handler_module.lambda_handler(
-            sample_api_gateway_event, sample_lambda_context
-        )
+        result = handler_module.lambda_handler(event, sample_lambda_context)
 
         # Assert
         assert result == {"isAuthorized": should_authorize}
         mock_logger.append_keys.assert_called_once_with(source_ip=source_ip)
 
+    @pytest.mark.parametrize(
+        "source_ip,allowed_ips,should_authorize",
+        [
+            ("192.168.1.100", "10.0.0.1,192.168.1.100", True),
+            ("10.0.0.1", " 10.0.0.1 , 192.168.1.100 ", True),
+            ("192.168.1.100", "10.0.0.1,,203.0.113.1", False),
+            ("192.168.1.10", "192.168.1.100", False),
+            ("192.168.1.100", "192.168.1.0/24", True),
+            ("192.168.2.100", "10.0.0.1,192.168.1.0/24", False),
+            ("2001:db8::1", "10.0.0.0/8,2001:db8::/32", True),
+            ("10.0.0.1", "::/0", False),
+            ("10.0.0.1", "not-an-ip,10.0.0.1", True),
+            ("192.168.1.5", "192.168.1.5/24", False),
+            ("192.168.1.100", "10.0.0.1,192.168.1.5/24", False),
+            ("not-an-ip", "10.0.0.1", False),
+        ],
+    )
+    def test_lambda_handler_comma_separated_allowed_ips(
+        self,
+        handler_module: MagicMock,
+        mock_logger: MagicMock,
+        mock_get_allowed_ip: MagicMock,
+        sample_api_gateway_event: Dict[str, Any],
+        sample_lambda_context: SimpleNamespace,
+        source_ip: str,
+        allowed_ips: str,
+        should_authorize: bool,
+    ):
+        """Test authorization against a list of IPs and CIDR networks."""
+        # Arrange
+        event = copy.deepcopy(sample_api_gateway_event)
+        event["requestContext"]["http"]["sourceIp"] = source_ip
+        mock_get_allowed_ip.return_value = allowed_ips
+
+        # Act
+        result = handler_module.lambda_handler(event, sample_lambda_context)
+
+        # Assert
+        assert result == {"isAuthorized": should_authorize}
+
     def test_lambda_handler_logging_context_injection(
         self,
         handler_module: MagicMock,
         mock_get_allowed_ip: MagicMock,
         sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
+        sample_lambda_context: SimpleNamespace,
     ):
         """Test that the lambda_handler has proper logging context injection."""
         # Arrange
@@ -325,53 +353,3 @@ class TestIPAuthorizerHandler:
         # Assert - Verify basic functionality
         assert "isAuthorized" in result
         assert isinstance(result["isAuthorized"], bool)
-
-    def test_lambda_handler_with_none_source_ip_in_http(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        mock_get_allowed_ip: MagicMock,
-        sample_lambda_context: MagicMock,
-    ):
-        """Test authorization denied when sourceIp is None in http context."""
-        # Arrange
-        event_with_none_source_ip = {
-            "requestContext": {"http": {"sourceIp": None}}
-        }
-
-        # Act
-        result = handler_module.lambda_handler(
-            event_with_none_source_ip, sample_lambda_context
-        )
-
-        # Assert
-        assert result == {"isAuthorized": False}
-        mock_logger.warning.assert_called_once_with(
-            "Source IP not found in the event. Denying request."
-        )
-        mock_get_allowed_ip.assert_not_called()
-
-    def test_lambda_handler_with_empty_string_source_ip(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        mock_get_allowed_ip: MagicMock,
-        sample_lambda_context: MagicMock,
-    ):
-        """Test authorization denied when sourceIp is empty string."""
-        # Arrange
-        event_with_empty_source_ip = {
-            "requestContext": {"http": {"sourceIp": ""}}
-        }
-
-        # Act
-        result = handler_module.lambda_handler(
-            event_with_empty_source_ip, sample_lambda_context
-        )
-
-        # Assert
-        assert result == {"isAuthorized": False}
-        mock_logger.warning.assert_called_once_with(
-            "Source IP not found in the event. Denying request."
-        )
-        mock_get_allowed_ip.assert_not_called()